@@ -21,9 +21,27 @@ namespace TouchlineMod.Core
         private MatchPatches _matchPatches;
         private bool _debugMode;
 
+        // ReadScreen working sets, cleared and reused on each read
+        private readonly List<GameObject> _rootObjects = new List<GameObject>();
+        private readonly List<string> _screenTexts = new List<string>();
+        private readonly HashSet<string> _seenTexts = new HashSet<string>();
+
         private const int MaxScreenTextItems = 50;
         private const int MaxTextCollectionDepth = 15;
 
+        // Keep in sync with the Hotkeys table below
+        private const string HelpText =
+            "Touchline keyboard shortcuts: " +
+            "Ctrl Shift D, toggle debug mode. " +
+            "Ctrl Shift S, scan UI. " +
+            "Ctrl Shift W, where am I. " +
+            "Ctrl Shift M, match score and commentary. " +
+            "Ctrl Shift R, read entire screen. " +
+            "Ctrl Shift H, this help. " +
+            "Escape, stop speech. " +
+            "Arrow keys, navigate. " +
+            "Enter or Space, activate.";
+
         private void Awake()
         {
             if (Instance != null && Instance != this)
@@ -40,8 +58,10 @@ namespace TouchlineMod.Core
 
             try
             {
+                // Read the persisted setting once here; the hotkey toggle keeps both in sync after that
+                _debugMode = TouchlineConfig.DebugMode.Value;
+
                 _focusTracker = gameObject.AddComponent<FocusTracker>();
-                _uiScanner = gameObject.AddComponent<UIScanner>();
                 _matchPatches = gameObject.AddComponent<MatchPatches>();
 
                 _focusTracker.OnFocusChanged += HandleFocusChanged;
@@ -67,58 +87,88 @@ namespace TouchlineMod.Core
             }
         }
 
-        private void HandleHotkeys()
+        [Flags]
+        private enum Modifiers
         {
-            // Ctrl+Shift+D - Toggle debug mode
-            if (IsKeyCombo(KeyCode.D, ctrl: true, shift: true))
-            {
-                _debugMode = !_debugMode;
-                TouchlineConfig.DebugMode.Value = _debugMode;
-                SpeechOutput.Speak(_debugMode ? "Debug mode on" : "Debug mode off");
-            }
+            None = 0,
+            Ctrl = 1,
+            Shift = 2,
+            Alt = 4
+        }
 
-            // Ctrl+Shift+S - Deep scan UI
-            if (IsKeyCombo(KeyCode.S, ctrl: true, shift: true))
-            {
-                SpeechOutput.Speak("Scanning UI...");
-                _uiScanner?.PerformDeepScan();
-            }
+        /// <summary>
+        /// A keyboard shortcut with its required modifiers resolved at build time.
+        /// </summary>
+        private readonly struct Hotkey
+        {
+            public readonly KeyCode Key;
+            public readonly Modifiers Modifiers;
+            public readonly Action<AccessibilityManager> Action;
 
-            // Ctrl+Shift+W - Where am I?
-            if (IsKeyCombo(KeyCode.W, ctrl: true, shift: true))
+            public Hotkey(KeyCode key, Modifiers modifiers, Action<AccessibilityManager> action)
             {
-                AnnounceCurrent();
+                Key = key;
+                Modifiers = modifiers;
+                Action = action;
             }
+        }
 
-            // Ctrl+Shift+H - Help
-            if (IsKeyCombo(KeyCode.H, ctrl: true, shift: true))
-            {
-                AnnounceHelp();
-            }
+        private const Modifiers CtrlShift = Modifiers.Ctrl | Modifiers.Shift;
 
-            // Ctrl+Shift+M - Match state
-            if (IsKeyCombo(KeyCode.M, ctrl: true, shift: true))
-            {
-                _matchPatches?.AnnounceMatchState();
-            }
+        /// <summary>
+        /// The keymap, shared by all instances and built once with the type. Each binding
+        /// carries its modifier mask, so dispatch reads the modifier keys a single time per
+        /// key press and compares masks per binding.
+        /// </summary>
+        private static readonly Hotkey[] Hotkeys =
+        {
+            new Hotkey(KeyCode.D, CtrlShift, m => m.ToggleDebugMode()),                      // Toggle debug mode
+            new Hotkey(KeyCode.S, CtrlShift, m => m.DeepScan()),                             // Deep scan UI
+            new Hotkey(KeyCode.W, CtrlShift, m => m.AnnounceCurrent()),                      // Where am I?
+            new Hotkey(KeyCode.H, CtrlShift, m => m.AnnounceHelp()),                         // Help
+            new Hotkey(KeyCode.M, CtrlShift, m => m._matchPatches?.AnnounceMatchState()),    // Match state
+            new Hotkey(KeyCode.R, CtrlShift, m => m.ReadScreen()),                           // Read entire visible screen
+            new Hotkey(KeyCode.Escape, Modifiers.None, _ => SpeechOutput.Silence()),         // Stop speech
+        };
 
-            // Ctrl+Shift+R - Read entire visible screen
-            if (IsKeyCombo(KeyCode.R, ctrl: true, shift: true))
-            {
-                ReadScreen();
-            }
+        private void HandleHotkeys()
+        {
+            // Every shortcut is a key-down event, so frames with no new key press
+            // (the vast majority) exit after a single input query.
+            if (!Input.anyKeyDown) return;
 
-            // Escape - Stop speech
-            if (Input.GetKeyDown(KeyCode.Escape))
+            Modifiers held = GetHeldModifiers();
+            foreach (var hotkey in Hotkeys)
             {
-                SpeechOutput.Silence();
+                // A binding fires when its key goes down while (at least) its modifiers are held
+                if ((held & hotkey.Modifiers) == hotkey.Modifiers && Input.GetKeyDown(hotkey.Key))
+                    hotkey.Action(this);
             }
         }
 
+        private void ToggleDebugMode()
+        {
+            _debugMode = !_debugMode;
+            TouchlineConfig.DebugMode.Value = _debugMode;
+            SpeechOutput.Speak(_debugMode ? "Debug mode on" : "Debug mode off");
+        }
+
+        private void DeepScan()
+        {
+            SpeechOutput.Speak("Scanning UI...");
+
+            // The scanner is a debugging aid most sessions never use; add it on first request
+            // rather than at startup so it costs nothing until then.
+            if (_uiScanner == null)
+                _uiScanner = gameObject.AddComponent<UIScanner>();
+            _uiScanner.PerformDeepScan();
+        }
+
         private void HandleFocusChanged(AccessibleElement previous, AccessibleElement current)
         {
             if (current == null) return;
-            if (!TouchlineConfig.AutoReadOnFocus.Value) return;
+            // Nothing will be spoken, so don't build the announcement string at all
+            if (!TouchlineConfig.SpeechEnabled.Value || !TouchlineConfig.AutoReadOnFocus.Value) return;
 
             string announcement = current.GetAnnouncement();
             SpeechOutput.Output(announcement);
@@ -155,22 +205,25 @@ namespace TouchlineMod.Core
         /// </summary>
         public void ReadScreen()
         {
+            if (!TouchlineConfig.SpeechEnabled.Value) return;
+
             try
             {
-                var rootObjects = new List<GameObject>();
-                var scene = UnityEngine.SceneManagement.SceneManager.GetActiveScene();
-                scene.GetRootGameObjects(rootObjects);
+                _rootObjects.Clear();
+                _screenTexts.Clear();
+                _seenTexts.Clear();
 
-                var screenTexts = new List<string>();
+                var scene = UnityEngine.SceneManagement.SceneManager.GetActiveScene();
+                scene.GetRootGameObjects(_rootObjects);
 
-                foreach (var root in rootObjects)
+                foreach (var root in _rootObjects)
                 {
-                    CollectVisibleText(root.transform, screenTexts, 0);
+                    CollectVisibleText(root.transform, _screenTexts, _seenTexts, 0);
                 }
 
-                if (screenTexts.Count > 0)
+                if (_screenTexts.Count > 0)
                 {
-                    string fullText = string.Join(". ", screenTexts);
+                    string fullText = string.Join(". ", _screenTexts);
                     SpeechOutput.Speak(fullText);
                 }
                 else
@@ -185,51 +238,49 @@ namespace TouchlineMod.Core
             }
         }
 
-        private void CollectVisibleText(Transform parent, List<string> texts, int depth)
+        /// <summary>
+        /// Collect visible text in hierarchy order. <paramref name="seen"/> mirrors
+        /// <paramref name="texts"/> so duplicate checks are a hash lookup, not a list scan.
+        /// </summary>
+        private void CollectVisibleText(Transform parent, List<string> texts, HashSet<string> seen, int depth)
         {
             if (parent == null || depth > MaxTextCollectionDepth) return;
-            if (!parent.gameObject.activeInHierarchy) return;
+            var obj = parent.gameObject;
+            if (!obj.activeInHierarchy) return;
 
-            string text = TextExtractor.ExtractDirect(parent.gameObject);
-            if (!string.IsNullOrEmpty(text))
+            // ExtractDirect already returns cleaned text
+            string text = TextExtractor.ExtractDirect(obj);
+            if (text.Length > 1 && seen.Add(text))
             {
-                string cleaned = TextCleaner.Clean(text);
-                if (!string.IsNullOrEmpty(cleaned) && cleaned.Length > 1 && !texts.Contains(cleaned))
-                {
-                    texts.Add(cleaned);
-                }
+                texts.Add(text);
             }
 
             if (texts.Count >= MaxScreenTextItems) return;
 
-            for (int i = 0; i < parent.childCount; i++)
+            int childCount = parent.childCount;
+            for (int i = 0; i < childCount; i++)
             {
-                CollectVisibleText(parent.GetChild(i), texts, depth + 1);
+                CollectVisibleText(parent.GetChild(i), texts, seen, depth + 1);
             }
         }
 
         public void AnnounceHelp()
         {
-            string help = "Touchline keyboard shortcuts: " +
-                          "Ctrl Shift D, toggle debug mode. " +
-                          "Ctrl Shift S, scan UI. " +
-                          "Ctrl Shift W, where am I. " +
-                          "Ctrl Shift M, match score and commentary. " +
-                          "Ctrl Shift R, read entire screen. " +
-                          "Ctrl Shift H, this help. " +
-                          "Escape, stop speech. " +
-                          "Arrow keys, navigate. " +
-                          "Enter or Space, activate.";
-            SpeechOutput.Speak(help);
-        }
-
-        private static bool IsKeyCombo(KeyCode key, bool ctrl = false, bool shift = false, bool alt = false)
-        {
-            if (!Input.GetKeyDown(key)) return false;
-            if (ctrl && !(Input.GetKey(KeyCode.LeftControl) || Input.GetKey(KeyCode.RightControl))) return false;
-            if (shift && !(Input.GetKey(KeyCode.LeftShift) || Input.GetKey(KeyCode.RightShift))) return false;
-            if (alt && !(Input.GetKey(KeyCode.LeftAlt) || Input.GetKey(KeyCode.RightAlt))) return false;
-            return true;
+            SpeechOutput.Speak(HelpText);
+        }
+
+        private static Modifiers GetHeldModifiers()
+        {
+            var held = Modifiers.None;
+            if (IsHeld(KeyCode.LeftControl, KeyCode.RightControl)) held |= Modifiers.Ctrl;
+            if (IsHeld(KeyCode.LeftShift, KeyCode.RightShift)) held |= Modifiers.Shift;
+            if (IsHeld(KeyCode.LeftAlt, KeyCode.RightAlt)) held |= Modifiers.Alt;
+            return held;
+        }
+
+        private static bool IsHeld(KeyCode left, KeyCode right)
+        {
+            return Input.GetKey(left) || Input.GetKey(right);
         }
 
         private void OnDestroy()
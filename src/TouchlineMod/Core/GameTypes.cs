@@ -0,0 +1,32 @@
+using System;
+using System.Collections.Generic;
+
+namespace TouchlineMod.Core
+{
+    /// <summary>
+    /// Resolves FM26 game types by assembly-qualified name at runtime.
+    /// Each name is looked up once and the result (including "not found") is cached,
+    /// so the patches and trackers that share a type don't each repeat the assembly probe.
+    /// </summary>
+    public static class GameTypes
+    {
+        public const string FMNavigationManager = "FM.UI.FMNavigationManager, FM.UI";
+        public const string MatchEventDispatcher = "FM.Match.MatchEventDispatcher, FM.Match";
+        public const string MatchEventHandler = "FM.UI.MatchEventHandler, FM.UI";
+
+        private static readonly Dictionary<string, Type> Resolved = new Dictionary<string, Type>();
+
+        /// <summary>
+        /// Get a game type by assembly-qualified name, or null if it isn't loaded.
+        /// </summary>
+        public static Type Find(string assemblyQualifiedName)
+        {
+            if (!Resolved.TryGetValue(assemblyQualifiedName, out var type))
+            {
+                type = Type.GetType(assemblyQualifiedName);
+                Resolved[assemblyQualifiedName] = type;
+            }
+            return type;
+        }
+    }
+}
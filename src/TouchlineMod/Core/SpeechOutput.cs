@@ -17,6 +17,11 @@ namespace TouchlineMod.Core
         private static bool _initialized;
         private static bool _tolkAvailable;
         private static bool _sapiAvailable;
+
+        // Set after a backend's first call failure so repeated failures don't log on every
+        // utterance. The backend itself stays in use; failures are often transient.
+        private static bool _tolkFailureWarned;
+        private static bool _sapiFailureWarned;
         private static bool _dllPathConfigured;
 
         #region Windows DLL Loading
@@ -78,6 +83,7 @@ namespace TouchlineMod.Core
         private static readonly Guid CLSID_SpVoice = new Guid("96749377-3391-11D2-9EE3-00C04F797396");
         private static readonly Guid IID_ISpVoice = new Guid("6C44DF74-72B9-4992-A1EC-EF996E0422D4");
         private static IntPtr _sapiVoice = IntPtr.Zero;
+        private static SpVoiceSpeakDelegate _sapiSpeak;
 
         private delegate int SpVoiceSpeakDelegate(
             IntPtr pThis,
@@ -93,12 +99,12 @@ namespace TouchlineMod.Core
         /// <summary>
         /// Set the DLL search path to the mod directory so Tolk.dll and its
         /// companion DLLs (nvdaControllerClient64.dll, SAAPI64.dll) are found.
-        /// Called once during Initialize(). Safe to call multiple times.
+        /// Called once during Initialize(), which restores the default path once Tolk
+        /// has loaded. Safe to call multiple times.
         /// </summary>
         private static void ConfigureDllSearchPath()
         {
             if (_dllPathConfigured) return;
-            _dllPathConfigured = true;
 
             try
             {
@@ -112,7 +118,7 @@ namespace TouchlineMod.Core
                 string modDirectory = Path.GetDirectoryName(assemblyLocation);
                 if (!string.IsNullOrEmpty(modDirectory) && Directory.Exists(modDirectory))
                 {
-                    SetDllDirectory(modDirectory);
+                    _dllPathConfigured = SetDllDirectory(modDirectory);
                     Log?.LogInfo($"DLL search path set to: {modDirectory}");
                 }
             }
@@ -122,6 +128,26 @@ namespace TouchlineMod.Core
             }
         }
 
+        /// <summary>
+        /// Restore the default DLL search order. SetDllDirectory applies to every later
+        /// LoadLibrary call in the process, including the game's own, so the mod directory
+        /// is only kept on the path while Tolk and its screen reader drivers load.
+        /// </summary>
+        private static void RestoreDllSearchPath()
+        {
+            if (!_dllPathConfigured) return;
+            _dllPathConfigured = false;
+
+            try
+            {
+                SetDllDirectory(null);
+            }
+            catch (Exception ex)
+            {
+                Log?.LogWarning($"Failed to restore DLL search path: {ex.Message}");
+            }
+        }
+
         /// <summary>
         /// Initialize the speech output system. Tries Tolk first, then SAPI.
         /// </summary>
@@ -133,6 +159,7 @@ namespace TouchlineMod.Core
             ConfigureDllSearchPath();
 
             _tolkAvailable = TryInitializeTolk();
+            RestoreDllSearchPath();
             if (!_tolkAvailable)
             {
                 _sapiAvailable = TryInitializeSapi();
@@ -186,6 +213,11 @@ namespace TouchlineMod.Core
                 int hr = CoCreateInstance(ref clsid, IntPtr.Zero, 1, ref iid, out _sapiVoice);
                 if (hr == 0 && _sapiVoice != IntPtr.Zero)
                 {
+                    // Resolve ISpVoice::Speak (vtable slot 20) once; the voice lives until Shutdown
+                    IntPtr vtable = Marshal.ReadIntPtr(_sapiVoice);
+                    IntPtr speakPtr = Marshal.ReadIntPtr(vtable, 20 * IntPtr.Size);
+                    _sapiSpeak = Marshal.GetDelegateForFunctionPointer<SpVoiceSpeakDelegate>(speakPtr);
+
                     Log.LogInfo("Windows SAPI initialized as fallback");
                     return true;
                 }
@@ -220,7 +252,7 @@ namespace TouchlineMod.Core
                 }
                 catch (Exception ex)
                 {
-                    Log.LogWarning($"Tolk speak failed: {ex.Message}");
+                    ReportBackendFailure(ref _tolkFailureWarned, "Tolk", "speak", ex);
                 }
             }
 
@@ -233,7 +265,7 @@ namespace TouchlineMod.Core
                 }
                 catch (Exception ex)
                 {
-                    Log.LogWarning($"SAPI speak failed: {ex.Message}");
+                    ReportBackendFailure(ref _sapiFailureWarned, "SAPI", "speak", ex);
                 }
             }
 
@@ -258,13 +290,24 @@ namespace TouchlineMod.Core
                 }
                 catch (Exception ex)
                 {
-                    Log.LogWarning($"Tolk output failed: {ex.Message}");
+                    ReportBackendFailure(ref _tolkFailureWarned, "Tolk", "output", ex);
                 }
             }
 
             Speak(text, interrupt);
         }
 
+        /// <summary>
+        /// Log a failed backend call, once per backend. This only rate-limits the warning;
+        /// the backend is not disabled and later calls still go through it.
+        /// </summary>
+        private static void ReportBackendFailure(ref bool warned, string backend, string operation, Exception ex)
+        {
+            if (warned) return;
+            warned = true;
+            Log.LogWarning($"{backend} {operation} failed (further failures not logged): {ex.Message}");
+        }
+
         /// <summary>
         /// Stop all current speech output.
         /// </summary>
@@ -287,7 +330,7 @@ namespace TouchlineMod.Core
                 _tolkAvailable = false;
             }
 
-            if (_sapiAvailable && _sapiVoice != IntPtr.Zero)
+            if (_sapiVoice != IntPtr.Zero)
             {
                 try
                 {
@@ -296,6 +339,7 @@ namespace TouchlineMod.Core
                 }
                 catch { }
                 _sapiVoice = IntPtr.Zero;
+                _sapiSpeak = null;
                 _sapiAvailable = false;
             }
 
@@ -304,16 +348,12 @@ namespace TouchlineMod.Core
 
         private static void SpeakSapi(string text, bool interrupt)
         {
-            if (_sapiVoice == IntPtr.Zero) return;
-
-            IntPtr vtable = Marshal.ReadIntPtr(_sapiVoice);
-            IntPtr speakPtr = Marshal.ReadIntPtr(vtable, 20 * IntPtr.Size);
-            var speakFunc = Marshal.GetDelegateForFunctionPointer<SpVoiceSpeakDelegate>(speakPtr);
+            if (_sapiVoice == IntPtr.Zero || _sapiSpeak == null) return;
 
             uint flags = SPF_ASYNC;
             if (interrupt) flags |= SPF_PURGEBEFORESPEAK;
 
-            speakFunc(_sapiVoice, text, flags, out _);
+            _sapiSpeak(_sapiVoice, text, flags, out _);
         }
     }
 }
@@ -1,3 +1,4 @@
+using System;
 using System.Text.RegularExpressions;
 
 namespace TouchlineMod.Core
@@ -33,7 +34,8 @@ namespace TouchlineMod.Core
         /// </summary>
         public static string Clean(string text)
         {
-            if (string.IsNullOrEmpty(text))
+            // Whitespace-only input cleans to empty; skip the regex passes entirely
+            if (string.IsNullOrWhiteSpace(text))
                 return string.Empty;
 
             // Remove Unity rich text tags
@@ -79,5 +81,28 @@ namespace TouchlineMod.Core
 
             return $"{cleanLabel}: {cleanValue}";
         }
+
+        /// <summary>
+        /// Case-insensitive substring test for GameObject names.
+        /// Avoids allocating a lowercased copy of the name on every lookup.
+        /// </summary>
+        public static bool ContainsIgnoreCase(string text, string value)
+        {
+            return text != null && text.IndexOf(value, StringComparison.OrdinalIgnoreCase) >= 0;
+        }
+
+        /// <summary>
+        /// Returns true if the text contains any of the given keywords (case-insensitive).
+        /// </summary>
+        public static bool ContainsAnyIgnoreCase(string text, string[] values)
+        {
+            if (text == null) return false;
+            foreach (string value in values)
+            {
+                if (text.IndexOf(value, StringComparison.OrdinalIgnoreCase) >= 0)
+                    return true;
+            }
+            return false;
+        }
     }
 }
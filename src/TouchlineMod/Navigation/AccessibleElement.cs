@@ -6,30 +6,63 @@ namespace TouchlineMod.Navigation
     /// </summary>
     public class AccessibleElement
     {
+        private string _name = string.Empty;
+        private string _elementType = "Unknown";
+        private string _value = string.Empty;
+        private string _state = string.Empty;
+        private string _positionHint = string.Empty;
+        private bool _isInteractable = true;
+
+        // Last built announcement and the config flags it was built with. Any setter that
+        // feeds the announcement clears it, so it is rebuilt only after a real change.
+        private string _announcement;
+        private bool _announcedType;
+        private bool _announcedState;
+
         /// <summary>
         /// Display name or label text of the element.
         /// </summary>
-        public string Name { get; set; } = string.Empty;
+        public string Name
+        {
+            get => _name;
+            set { _name = value; _announcement = null; }
+        }
 
         /// <summary>
         /// Type of UI element (Button, Label, Toggle, Dropdown, InputField, Table, TableRow, etc.)
         /// </summary>
-        public string ElementType { get; set; } = "Unknown";
+        public string ElementType
+        {
+            get => _elementType;
+            set { _elementType = value; _announcement = null; }
+        }
 
         /// <summary>
         /// Current value or content of the element (e.g., input field text, dropdown selection).
         /// </summary>
-        public string Value { get; set; } = string.Empty;
+        public string Value
+        {
+            get => _value;
+            set { _value = value; _announcement = null; }
+        }
 
         /// <summary>
         /// Current state description (e.g., "checked", "unchecked", "selected", "disabled").
         /// </summary>
-        public string State { get; set; } = string.Empty;
+        public string State
+        {
+            get => _state;
+            set { _state = value; _announcement = null; }
+        }
 
         /// <summary>
         /// Position hint for lists/tables (e.g., "3 of 15").
         /// </summary>
-        public string PositionHint { get; set; } = string.Empty;
+        public string PositionHint
+        {
+            get => _positionHint;
+            set { _positionHint = value; _announcement = null; }
+        }
 
         /// <summary>
         /// Additional context (e.g., parent container name, table column headers).
@@ -37,20 +70,38 @@ namespace TouchlineMod.Navigation
         public string Context { get; set; } = string.Empty;
 
         /// <summary>
-        /// Full path in the UI hierarchy for debugging.
+        /// Full path in the UI hierarchy for debugging. Only filled in while debug mode is on.
         /// </summary>
         public string HierarchyPath { get; set; } = string.Empty;
 
         /// <summary>
         /// Whether this element is currently interactable.
         /// </summary>
-        public bool IsInteractable { get; set; } = true;
+        public bool IsInteractable
+        {
+            get => _isInteractable;
+            set { _isInteractable = value; _announcement = null; }
+        }
 
         /// <summary>
         /// Build an announcement string for screen reader output.
         /// Follows a consistent order: Name, Value, Type, State, Position.
         /// </summary>
         public string GetAnnouncement()
+        {
+            bool announceType = Config.TouchlineConfig.AnnounceElementType.Value;
+            bool announceState = Config.TouchlineConfig.AnnounceElementState.Value;
+
+            if (_announcement == null || announceType != _announcedType || announceState != _announcedState)
+            {
+                _announcement = BuildAnnouncement(announceType, announceState);
+                _announcedType = announceType;
+                _announcedState = announceState;
+            }
+            return _announcement;
+        }
+
+        private string BuildAnnouncement(bool announceType, bool announceState)
         {
             var parts = new System.Collections.Generic.List<string>();
 
@@ -60,10 +111,10 @@ namespace TouchlineMod.Navigation
             if (!string.IsNullOrEmpty(Value))
                 parts.Add(Core.TextCleaner.Clean(Value));
 
-            if (!string.IsNullOrEmpty(ElementType) && Config.TouchlineConfig.AnnounceElementType.Value)
+            if (!string.IsNullOrEmpty(ElementType) && announceType)
                 parts.Add(ElementType);
 
-            if (!string.IsNullOrEmpty(State) && Config.TouchlineConfig.AnnounceElementState.Value)
+            if (!string.IsNullOrEmpty(State) && announceState)
                 parts.Add(State);
 
             if (!string.IsNullOrEmpty(PositionHint))
@@ -2,6 +2,7 @@ using UnityEngine;
 using UnityEngine.UI;
 using System;
 using System.Collections.Generic;
+using System.Reflection;
 using TouchlineMod.Core;
 using TouchlineMod.Config;
 
@@ -30,22 +31,41 @@ namespace TouchlineMod.Navigation
         // Table tracking
         private GameObject _currentTableContainer;
         private bool _tableHeadersAnnounced;
-        private List<string> _cachedHeaders;
+        private GameObject _lastReadRow;
+
+        // Headers of the current table; refilled in place when focus enters a new table
+        private readonly List<string> _cachedHeaders = new List<string>();
+
+        // Cleaned container names keyed by raw GameObject name (see GetContextName)
+        private readonly Dictionary<string, string> _contextNames = new Dictionary<string, string>();
+
+        // FMNavigationManager.CurrentFocus, resolved lazily; null when FM.UI is unavailable
+        private static PropertyInfo _fmFocusProperty;
+        private static bool _fmFocusResolved;
 
         private const int MaxParentContextDepth = 10;
 
+        // Name fragments used to classify ancestors of the focused element
+        private static readonly string[] ContainerKeywords =
+            { "screen", "panel", "page", "menu", "tab", "section", "view", "dialog", "window" };
+        private static readonly string[] RowKeywords = { "row", "item", "entry" };
+        private static readonly string[] TableKeywords = { "table", "grid", "list" };
+
         private void Update()
         {
             TrackFocus();
 
-            // Delayed announcement to prevent rapid-fire speech
+            // Delayed announcement to prevent rapid-fire speech. Only the element that still
+            // has focus when the delay expires is announced; intermediate focus targets
+            // (e.g. while an arrow key auto-repeats) are dropped without being processed.
+            // Unscaled time keeps the delay running on paused screens where timeScale is 0.
             if (_pendingAnnouncement)
             {
-                _focusChangeTimer -= Time.deltaTime;
+                _focusChangeTimer -= Time.unscaledDeltaTime;
                 if (_focusChangeTimer <= 0f)
                 {
                     _pendingAnnouncement = false;
-                    // The event was already fired; this just gates rapid changes
+                    AnnounceFocus(_lastFocusedObject);
                 }
             }
         }
@@ -64,24 +84,39 @@ namespace TouchlineMod.Navigation
             if (focusedObj == null || focusedObj == _lastFocusedObject)
                 return;
 
-            var previousElement = CurrentElement;
             _lastFocusedObject = focusedObj;
 
+            // (Re)start the delay; a newer focus change supersedes any pending one
+            _focusChangeTimer = TouchlineConfig.FocusChangeDelay.Value;
+            _pendingAnnouncement = true;
+        }
+
+        /// <summary>
+        /// Build the accessible element for the settled focus target and fire OnFocusChanged.
+        /// </summary>
+        private void AnnounceFocus(GameObject focusedObj)
+        {
+            if (focusedObj == null) return;
+
+            var previousElement = CurrentElement;
+
             // Build accessible element from the focused GameObject
             CurrentElement = BuildAccessibleElement(focusedObj);
 
-            // Check for table context
-            CheckTableContext(focusedObj);
-
-            // Fire event with delay
-            _focusChangeTimer = TouchlineConfig.FocusChangeDelay.Value;
-            _pendingAnnouncement = true;
+            // Check for table context. This runs first because it sets the position hint
+            // the focus announcement reads; its header/row text is queued after that announcement.
+            string tableSpeech = CheckTableContext(focusedObj);
 
             OnFocusChanged?.Invoke(previousElement, CurrentElement);
 
+            if (!string.IsNullOrEmpty(tableSpeech))
+            {
+                SpeechOutput.Speak(tableSpeech, false);
+            }
+
             if (TouchlineConfig.DebugMode.Value)
             {
-                Plugin.Log.LogInfo($"Focus: {CurrentElement}");
+                Plugin.Log.LogInfo($"Focus: {CurrentElement} at {CurrentElement.HierarchyPath}");
             }
         }
 
@@ -93,13 +128,7 @@ namespace TouchlineMod.Navigation
         {
             try
             {
-                // FM26 uses FMNavigationManager.CurrentFocus for keyboard nav.
-                // Access via reflection to avoid hard dependency on FM.UI at compile time.
-                var navType = Type.GetType("FM.UI.FMNavigationManager, FM.UI");
-                if (navType == null) return null;
-
-                var focusProp = navType.GetProperty("CurrentFocus",
-                    System.Reflection.BindingFlags.Public | System.Reflection.BindingFlags.Static);
+                var focusProp = GetFMFocusProperty();
                 if (focusProp == null) return null;
 
                 var focusObj = focusProp.GetValue(null);
@@ -119,6 +148,25 @@ namespace TouchlineMod.Navigation
             return null;
         }
 
+        /// <summary>
+        /// Resolve FMNavigationManager.CurrentFocus on first use and cache the result
+        /// (including a miss), so the per-frame focus check does no type lookup.
+        /// </summary>
+        private static PropertyInfo GetFMFocusProperty()
+        {
+            if (!_fmFocusResolved)
+            {
+                _fmFocusResolved = true;
+
+                // FM26 uses FMNavigationManager.CurrentFocus for keyboard nav.
+                // Access via reflection to avoid hard dependency on FM.UI at compile time.
+                var navType = GameTypes.Find(GameTypes.FMNavigationManager);
+                _fmFocusProperty = navType?.GetProperty("CurrentFocus",
+                    BindingFlags.Public | BindingFlags.Static);
+            }
+            return _fmFocusProperty;
+        }
+
         /// <summary>
         /// Get the currently selected UI object via Unity's EventSystem.
         /// </summary>
@@ -133,54 +181,57 @@ namespace TouchlineMod.Navigation
         /// </summary>
         private AccessibleElement BuildAccessibleElement(GameObject obj)
         {
-            var element = new AccessibleElement
-            {
-                HierarchyPath = GetHierarchyPath(obj)
-            };
+            var element = new AccessibleElement();
 
-            // Check for common UI component types
-            var text = obj.GetComponentInChildren<Text>();
-            var tmpText = GetTMPText(obj);
-            var button = obj.GetComponent<Button>();
-            var toggle = obj.GetComponent<Toggle>();
-            var dropdown = obj.GetComponent<Dropdown>();
-            var inputField = obj.GetComponent<InputField>();
-            var selectable = obj.GetComponent<Selectable>();
+            // The path is only ever read for debugging; skip the full parent walk otherwise
+            if (TouchlineConfig.DebugMode.Value)
+                element.HierarchyPath = GetHierarchyPath(obj);
+
+            // Check for common UI component types. Each GetComponent is an interop call, so
+            // look them up in priority order and stop at the first match.
+            Button button;
+            Toggle toggle;
+            Dropdown dropdown;
+            InputField inputField;
+            Selectable selectable;
 
             // Determine element type and extract info
-            if (button != null)
+            if ((button = obj.GetComponent<Button>()) != null)
             {
                 element.ElementType = "Button";
                 element.Name = ExtractText(obj);
                 element.IsInteractable = button.interactable;
             }
-            else if (toggle != null)
+            else if ((toggle = obj.GetComponent<Toggle>()) != null)
             {
                 element.ElementType = "Checkbox";
                 element.Name = ExtractText(obj);
                 element.State = toggle.isOn ? "checked" : "unchecked";
                 element.IsInteractable = toggle.interactable;
             }
-            else if (dropdown != null)
+            else if ((dropdown = obj.GetComponent<Dropdown>()) != null)
             {
                 element.ElementType = "Dropdown";
                 element.Name = ExtractText(obj);
-                if (dropdown.options != null && dropdown.value >= 0 && dropdown.value < dropdown.options.Count)
+                var options = dropdown.options;
+                int selected = dropdown.value;
+                if (options != null && selected >= 0 && selected < options.Count)
                 {
-                    element.Value = TextCleaner.Clean(dropdown.options[dropdown.value].text);
+                    element.Value = TextCleaner.Clean(options[selected].text);
                 }
                 element.IsInteractable = dropdown.interactable;
             }
-            else if (inputField != null)
+            else if ((inputField = obj.GetComponent<InputField>()) != null)
             {
+                string fieldText = inputField.text;
                 element.ElementType = "Text field";
-                element.Name = !string.IsNullOrEmpty(inputField.text)
-                    ? inputField.text
+                element.Name = !string.IsNullOrEmpty(fieldText)
+                    ? fieldText
                     : (inputField.placeholder is Text ph ? ph.text : "");
-                element.Value = inputField.text;
+                element.Value = fieldText;
                 element.IsInteractable = inputField.interactable;
             }
-            else if (selectable != null)
+            else if ((selectable = obj.GetComponent<Selectable>()) != null)
             {
                 element.ElementType = "Element";
                 element.Name = ExtractText(obj);
@@ -208,14 +259,11 @@ namespace TouchlineMod.Navigation
             while (parent != null && depth < MaxParentContextDepth)
             {
                 string name = parent.name;
-                string lower = name.ToLower();
                 // Look for meaningful container names
-                if (lower.Contains("screen") || lower.Contains("panel") || lower.Contains("page")
-                    || lower.Contains("menu") || lower.Contains("tab") || lower.Contains("section")
-                    || lower.Contains("view") || lower.Contains("dialog") || lower.Contains("window"))
+                if (TextCleaner.ContainsAnyIgnoreCase(name, ContainerKeywords))
                 {
-                    string cleaned = TextCleaner.Clean(name.Replace("_", " "));
-                    if (!string.IsNullOrEmpty(cleaned) && cleaned.Length > 2)
+                    string cleaned = GetContextName(name);
+                    if (cleaned.Length > 0)
                     {
                         return cleaned;
                     }
@@ -226,6 +274,23 @@ namespace TouchlineMod.Navigation
             return string.Empty;
         }
 
+        /// <summary>
+        /// Clean a container name for announcement. The same few panel names come up on
+        /// every focus change within a screen, so results are cached per raw name.
+        /// Returns an empty string for names too short to be meaningful.
+        /// </summary>
+        private string GetContextName(string rawName)
+        {
+            if (!_contextNames.TryGetValue(rawName, out var cleaned))
+            {
+                cleaned = TextCleaner.Clean(rawName.Replace("_", " "));
+                if (cleaned.Length <= 2)
+                    cleaned = string.Empty;
+                _contextNames[rawName] = cleaned;
+            }
+            return cleaned;
+        }
+
         /// <summary>
         /// Extract readable text from a GameObject, checking Text, TMP_Text, and child elements.
         /// </summary>
@@ -247,108 +312,108 @@ namespace TouchlineMod.Navigation
 
         /// <summary>
         /// Try to get TextMeshPro text via reflection (avoids compile-time dependency).
+        /// Shares TextExtractor's per-type property cache rather than reflecting on every call.
         /// </summary>
         private string GetTMPText(GameObject obj)
         {
             try
             {
                 // Look for TMP_Text component in children
-                var components = obj.GetComponentsInChildren<Component>();
-                foreach (var comp in components)
-                {
-                    if (comp == null) continue;
-                    var type = comp.GetType();
-                    if (type.Name == "TMP_Text" || type.Name == "TextMeshProUGUI" || type.Name == "TextMeshPro")
-                    {
-                        var textProp = type.GetProperty("text");
-                        if (textProp != null)
-                        {
-                            return textProp.GetValue(comp) as string;
-                        }
-                    }
-                }
+                return UI.TextExtractor.ExtractTMPText(obj.GetComponentsInChildren<Component>());
             }
             catch { }
             return null;
         }
 
         /// <summary>
-        /// Check if the focused element is inside a table and announce headers if needed.
+        /// Check if the focused element is inside a table and build the header announcement if needed.
         /// Also reads the full table row when ReadFullTableRow is enabled.
         /// </summary>
-        private void CheckTableContext(GameObject obj)
+        /// <returns>Header and row text to speak after the focus announcement, or null.</returns>
+        private string CheckTableContext(GameObject obj)
         {
-            // Look for table-like parent containers
-            var parent = obj.transform.parent;
+            // Look for table-like parent containers. The child of the current parent is
+            // tracked during the walk, so the table's item is known when the table is found.
+            var child = obj.transform;
+            var parent = child.parent;
             GameObject rowObj = null;
 
             while (parent != null)
             {
-                string name = parent.name.ToLower();
+                string name = parent.name;
 
                 // Detect row containers (the element's immediate parent in a table)
-                if (name.Contains("row") || name.Contains("item") || name.Contains("entry"))
+                if (TextCleaner.ContainsAnyIgnoreCase(name, RowKeywords))
                 {
                     rowObj = parent.gameObject;
                 }
 
-                if (name.Contains("table") || name.Contains("grid") || name.Contains("list"))
+                if (TextCleaner.ContainsAnyIgnoreCase(name, TableKeywords))
                 {
-                    if (parent.gameObject != _currentTableContainer)
+                    // gameObject is an interop call under IL2CPP; read it once
+                    var tableObj = parent.gameObject;
+                    if (tableObj != _currentTableContainer)
                     {
-                        _currentTableContainer = parent.gameObject;
+                        _currentTableContainer = tableObj;
                         _tableHeadersAnnounced = false;
-                        _cachedHeaders = null;
+                        _lastReadRow = null;
+                        _cachedHeaders.Clear();
                     }
 
-                    if (!_tableHeadersAnnounced && TouchlineConfig.AnnounceTableHeaders.Value)
+                    // Header and row extraction only feed speech; skip them while muted
+                    bool speechEnabled = TouchlineConfig.SpeechEnabled.Value;
+                    string headerText = null;
+                    string rowText = null;
+
+                    if (speechEnabled && !_tableHeadersAnnounced && TouchlineConfig.AnnounceTableHeaders.Value)
                     {
-                        AnnounceTableHeaders(parent.gameObject);
+                        headerText = GetTableHeaderAnnouncement(tableObj);
                         _tableHeadersAnnounced = true;
                     }
 
                     // Announce list position ("X of Y")
-                    ComputePositionHint(obj, parent);
+                    ComputePositionHint(child, parent);
 
-                    // Read full table row if enabled
-                    if (TouchlineConfig.ReadFullTableRow.Value && rowObj != null)
+                    // Read full table row if enabled. Moving between cells of the same row
+                    // would repeat the identical row text, so each row is read once on entry.
+                    if (speechEnabled && TouchlineConfig.ReadFullTableRow.Value && rowObj != null &&
+                        rowObj != _lastReadRow)
                     {
-                        ReadTableRow(rowObj);
+                        rowText = GetTableRowText(rowObj);
+                        _lastReadRow = rowObj;
                     }
 
-                    return;
+                    // Join headers and row into one utterance rather than two back-to-back
+                    if (!string.IsNullOrEmpty(headerText) && !string.IsNullOrEmpty(rowText))
+                        return headerText + ". " + rowText;
+                    return headerText ?? rowText;
                 }
+                child = parent;
                 parent = parent.parent;
             }
 
             // Not in a table anymore
             _currentTableContainer = null;
             _tableHeadersAnnounced = false;
-            _cachedHeaders = null;
+            _lastReadRow = null;
+            _cachedHeaders.Clear();
+            return null;
         }
 
         /// <summary>
         /// Compute list/table position hint ("X of Y") for the current element.
         /// </summary>
-        private void ComputePositionHint(GameObject obj, Transform container)
+        /// <param name="item">The row/item holding the element; a direct child of the container.</param>
+        /// <param name="container">The table or list container that was found.</param>
+        private void ComputePositionHint(Transform item, Transform container)
         {
             if (CurrentElement == null) return;
 
             try
             {
-                // Find the row/item parent that is a direct child of the container
-                Transform itemParent = obj.transform;
-                while (itemParent != null && itemParent.parent != container)
-                {
-                    itemParent = itemParent.parent;
-                }
-
-                if (itemParent != null && itemParent.parent == container)
-                {
-                    int index = itemParent.GetSiblingIndex() + 1;
-                    int total = container.childCount;
-                    CurrentElement.PositionHint = $"{index} of {total}";
-                }
+                int index = item.GetSiblingIndex() + 1;
+                int total = container.childCount;
+                CurrentElement.PositionHint = $"{index} of {total}";
             }
             catch { }
         }
@@ -356,54 +421,31 @@ namespace TouchlineMod.Navigation
         /// <summary>
         /// Read the full contents of a table row using TextExtractor.
         /// </summary>
-        private void ReadTableRow(GameObject rowObj)
+        private string GetTableRowText(GameObject rowObj)
         {
             try
             {
-                string rowText = UI.TextExtractor.ExtractTableRow(rowObj, _cachedHeaders);
-                if (!string.IsNullOrEmpty(rowText))
-                {
-                    SpeechOutput.Speak(rowText, false);
-                }
+                return UI.TextExtractor.ExtractTableRow(rowObj, _cachedHeaders);
+            }
+            catch
+            {
+                return null;
             }
-            catch { }
         }
 
-        private void AnnounceTableHeaders(GameObject tableObj)
+        /// <summary>
+        /// Load the column headers for a table and build the "Table columns" announcement.
+        /// </summary>
+        /// <returns>The announcement, or null if the table has no header row.</returns>
+        private string GetTableHeaderAnnouncement(GameObject tableObj)
         {
             // Use TextExtractor to get headers (searches multiple common patterns)
-            _cachedHeaders = UI.TextExtractor.ExtractTableHeaders(tableObj);
+            UI.TextExtractor.ExtractTableHeaders(tableObj, _cachedHeaders);
 
-            if (_cachedHeaders.Count > 0)
-            {
-                SpeechOutput.Speak("Table columns: " + string.Join(", ", _cachedHeaders), false);
-            }
-            else
-            {
-                // Fallback: look for header row with legacy search
-                var headers = new List<string>();
-                var headerTransform = tableObj.transform.Find("Header");
-                if (headerTransform == null)
-                    headerTransform = tableObj.transform.Find("Headers");
-                if (headerTransform == null)
-                    headerTransform = tableObj.transform.Find("ColumnHeaders");
-
-                if (headerTransform != null)
-                {
-                    foreach (Transform child in headerTransform)
-                    {
-                        string headerText = ExtractText(child.gameObject);
-                        if (!string.IsNullOrEmpty(headerText))
-                            headers.Add(headerText);
-                    }
-
-                    if (headers.Count > 0)
-                    {
-                        _cachedHeaders = headers;
-                        SpeechOutput.Speak("Table columns: " + string.Join(", ", headers), false);
-                    }
-                }
-            }
+            // ExtractTableHeaders already tries every known header container name and keeps a
+            // placeholder for unlabeled columns, so an empty result means there is no header row.
+            if (_cachedHeaders.Count == 0) return null;
+            return "Table columns: " + string.Join(", ", _cachedHeaders);
         }
 
         /// <summary>
@@ -411,14 +453,16 @@ namespace TouchlineMod.Navigation
         /// </summary>
         private static string GetHierarchyPath(GameObject obj)
         {
-            string path = obj.name;
+            // Collect names leaf-first and join once, rather than re-copying the path per level
+            var names = new List<string> { obj.name };
             Transform current = obj.transform.parent;
             while (current != null)
             {
-                path = current.name + "/" + path;
+                names.Add(current.name);
                 current = current.parent;
             }
-            return path;
+            names.Reverse();
+            return string.Join("/", names);
         }
     }
 }
@@ -33,7 +33,7 @@ namespace TouchlineMod.Patches
         {
             try
             {
-                var navType = Type.GetType("FM.UI.FMNavigationManager, FM.UI");
+                var navType = GameTypes.Find(GameTypes.FMNavigationManager);
                 if (navType == null)
                 {
                     Plugin.Log.LogInfo("FM.UI.FMNavigationManager not found - navigation patch skipped");
@@ -1,6 +1,7 @@
 using HarmonyLib;
 using System;
 using System.Collections.Generic;
+using System.Reflection;
 using TouchlineMod.Core;
 using TouchlineMod.Config;
 using UnityEngine;
@@ -19,10 +20,29 @@ namespace TouchlineMod.Patches
         private string _lastCommentary = string.Empty;
         private string _lastScore = string.Empty;
         private float _pollTimer;
+        private float _fullScanTimer;
+
+        // Reused between scans so polling doesn't allocate a new list each time
+        private readonly List<GameObject> _rootObjects = new List<GameObject>();
+
+        // Panels found by the last full hierarchy scan; read directly on the polls in between
+        private readonly List<Transform> _commentaryPanels = new List<Transform>();
+        private readonly List<Transform> _scorePanels = new List<Transform>();
 
         private const float PollInterval = 0.5f;
+        private const float FullScanInterval = 2f;
         private const int MaxChildScanDepth = 50;
 
+        private static readonly string[] CommentaryKeywords = { "commentary", "matchtext", "narration" };
+
+        // Candidate match event hook methods and text properties, probed in order
+        private static readonly string[] MatchEventMethodNames = { "OnGoal", "OnMatchEvent", "RaiseEvent", "HandleEvent" };
+        private static readonly string[] MatchEventTextPropertyNames = { "Description", "Text", "EventText", "Message" };
+
+        // Text properties of each patched event source type, probed once per type
+        private static readonly Dictionary<Type, PropertyInfo[]> MatchEventTextProperties =
+            new Dictionary<Type, PropertyInfo[]>();
+
         private void Awake()
         {
             if (Instance != null && Instance != this)
@@ -31,19 +51,45 @@ namespace TouchlineMod.Patches
                 return;
             }
             Instance = this;
+
+            // Polling only feeds speech. Rather than checking the setting every frame, the
+            // component is disabled while speech is off, so Unity skips Update entirely.
+            enabled = TouchlineConfig.SpeechEnabled.Value;
+            TouchlineConfig.SpeechEnabled.SettingChanged += OnSpeechEnabledChanged;
         }
 
-        private void Update()
+        private void OnDestroy()
         {
-            if (!TouchlineConfig.SpeechEnabled.Value) return;
+            if (Instance == this)
+            {
+                TouchlineConfig.SpeechEnabled.SettingChanged -= OnSpeechEnabledChanged;
+                Instance = null;
+            }
+        }
 
+        private void OnSpeechEnabledChanged(object sender, EventArgs e)
+        {
+            enabled = TouchlineConfig.SpeechEnabled.Value;
+        }
+
+        private void Update()
+        {
             _pollTimer -= Time.deltaTime;
+            _fullScanTimer -= Time.deltaTime;
             if (_pollTimer > 0f) return;
             _pollTimer = PollInterval;
 
             try
             {
-                PollViaUIScanning();
+                // Walking the whole scene is the expensive part. Until both a commentary and a
+                // score panel are known every poll scans; after that a scan only happens every
+                // FullScanInterval (or when a known panel goes away), and the polls in between
+                // just re-read the panels the last scan found.
+                if (_fullScanTimer <= 0f || !PollCachedPanels())
+                {
+                    _fullScanTimer = FullScanInterval;
+                    PollViaUIScanning();
+                }
             }
             catch (Exception ex)
             {
@@ -59,15 +105,17 @@ namespace TouchlineMod.Patches
         /// </summary>
         private void PollViaUIScanning()
         {
-            var rootObjects = new List<GameObject>();
+            _commentaryPanels.Clear();
+            _scorePanels.Clear();
+            _rootObjects.Clear();
             try
             {
                 var scene = UnityEngine.SceneManagement.SceneManager.GetActiveScene();
-                scene.GetRootGameObjects(rootObjects);
+                scene.GetRootGameObjects(_rootObjects);
             }
             catch { return; }
 
-            foreach (var root in rootObjects)
+            foreach (var root in _rootObjects)
             {
                 ScanForMatchPanels(root.transform);
             }
@@ -80,33 +128,25 @@ namespace TouchlineMod.Patches
         {
             if (parent == null) return;
 
-            string objName = parent.name.ToLower();
+            string objName = parent.name;
 
             // Look for commentary panels
-            if (objName.Contains("commentary") || objName.Contains("matchtext")
-                || objName.Contains("narration"))
+            if (TextCleaner.ContainsAnyIgnoreCase(objName, CommentaryKeywords))
             {
-                string text = UI.TextExtractor.ExtractAll(parent.gameObject);
-                if (!string.IsNullOrEmpty(text) && text != _lastCommentary)
-                {
-                    _lastCommentary = text;
-                    SpeechOutput.Speak(TextCleaner.Clean(text), false);
-                }
+                _commentaryPanels.Add(parent);
+                ReadCommentaryPanel(parent);
             }
 
             // Look for score display
-            if (objName.Contains("score") && !objName.Contains("scorer"))
+            if (TextCleaner.ContainsIgnoreCase(objName, "score") && !TextCleaner.ContainsIgnoreCase(objName, "scorer"))
             {
-                string text = UI.TextExtractor.ExtractAll(parent.gameObject);
-                if (!string.IsNullOrEmpty(text) && text != _lastScore)
-                {
-                    _lastScore = text;
-                    SpeechOutput.Speak($"Score: {TextCleaner.Clean(text)}");
-                }
+                _scorePanels.Add(parent);
+                ReadScorePanel(parent);
             }
 
             // Scan children (limit depth)
-            for (int i = 0; i < parent.childCount && i < MaxChildScanDepth; i++)
+            int childCount = Math.Min(parent.childCount, MaxChildScanDepth);
+            for (int i = 0; i < childCount; i++)
             {
                 var child = parent.GetChild(i);
                 if (child != null && child.gameObject.activeInHierarchy)
@@ -116,6 +156,54 @@ namespace TouchlineMod.Patches
             }
         }
 
+        /// <summary>
+        /// Re-read the panels found by the last full scan.
+        /// </summary>
+        /// <returns>
+        /// False if either kind of panel has not been found yet or one is gone, meaning a full
+        /// scan is needed.
+        /// </returns>
+        private bool PollCachedPanels()
+        {
+            if (_commentaryPanels.Count == 0 || _scorePanels.Count == 0) return false;
+
+            foreach (var panel in _commentaryPanels)
+            {
+                if (panel == null || !panel.gameObject.activeInHierarchy) return false;
+            }
+            foreach (var panel in _scorePanels)
+            {
+                if (panel == null || !panel.gameObject.activeInHierarchy) return false;
+            }
+
+            foreach (var panel in _commentaryPanels)
+                ReadCommentaryPanel(panel);
+            foreach (var panel in _scorePanels)
+                ReadScorePanel(panel);
+            return true;
+        }
+
+        private void ReadCommentaryPanel(Transform panel)
+        {
+            // ExtractAll output is already cleaned; speak it as-is
+            string text = UI.TextExtractor.ExtractAll(panel.gameObject);
+            if (!string.IsNullOrEmpty(text) && text != _lastCommentary)
+            {
+                _lastCommentary = text;
+                SpeechOutput.Speak(text, false);
+            }
+        }
+
+        private void ReadScorePanel(Transform panel)
+        {
+            string text = UI.TextExtractor.ExtractAll(panel.gameObject);
+            if (!string.IsNullOrEmpty(text) && text != _lastScore)
+            {
+                _lastScore = text;
+                SpeechOutput.Speak($"Score: {text}");
+            }
+        }
+
         /// <summary>
         /// Apply Harmony patches for match engine hooks.
         /// </summary>
@@ -125,8 +213,8 @@ namespace TouchlineMod.Patches
             // If the game types aren't available, we fall back to UI polling above.
             try
             {
-                var matchEventType = Type.GetType("FM.Match.MatchEventDispatcher, FM.Match")
-                    ?? Type.GetType("FM.UI.MatchEventHandler, FM.UI");
+                var matchEventType = GameTypes.Find(GameTypes.MatchEventDispatcher)
+                    ?? GameTypes.Find(GameTypes.MatchEventHandler);
 
                 if (matchEventType == null)
                 {
@@ -134,12 +222,13 @@ namespace TouchlineMod.Patches
                     return;
                 }
 
-                foreach (string methodName in new[] { "OnGoal", "OnMatchEvent", "RaiseEvent", "HandleEvent" })
+                // Every candidate hook gets the same postfix; resolve it once
+                var postfix = new HarmonyMethod(typeof(MatchPatches), nameof(OnMatchEvent_Postfix));
+                foreach (string methodName in MatchEventMethodNames)
                 {
                     var method = AccessTools.Method(matchEventType, methodName);
                     if (method != null)
                     {
-                        var postfix = new HarmonyMethod(typeof(MatchPatches), nameof(OnMatchEvent_Postfix));
                         harmony.Patch(method, postfix: postfix);
                         Plugin.Log.LogInfo($"Patched match event: {matchEventType.Name}.{methodName}");
                     }
@@ -157,24 +246,41 @@ namespace TouchlineMod.Patches
             {
                 if (!TouchlineConfig.SpeechEnabled.Value) return;
 
-                var type = __instance.GetType();
-                foreach (string propName in new[] { "Description", "Text", "EventText", "Message" })
+                foreach (var prop in GetMatchEventTextProperties(__instance.GetType()))
                 {
-                    var prop = type.GetProperty(propName);
-                    if (prop != null && prop.PropertyType == typeof(string))
+                    string text = prop.GetValue(__instance) as string;
+                    if (!string.IsNullOrEmpty(text))
                     {
-                        string text = prop.GetValue(__instance) as string;
-                        if (!string.IsNullOrEmpty(text))
-                        {
-                            SpeechOutput.Speak(TextCleaner.Clean(text));
-                            return;
-                        }
+                        SpeechOutput.Speak(TextCleaner.Clean(text));
+                        return;
                     }
                 }
             }
             catch { }
         }
 
+        /// <summary>
+        /// Get the string text properties of a match event source type, in probe order.
+        /// Resolved once per type; events fire often during a match.
+        /// </summary>
+        private static PropertyInfo[] GetMatchEventTextProperties(Type type)
+        {
+            if (!MatchEventTextProperties.TryGetValue(type, out var props))
+            {
+                var found = new List<PropertyInfo>();
+                foreach (string propName in MatchEventTextPropertyNames)
+                {
+                    var prop = type.GetProperty(propName);
+                    if (prop != null && prop.PropertyType == typeof(string))
+                        found.Add(prop);
+                }
+
+                props = found.ToArray();
+                MatchEventTextProperties[type] = props;
+            }
+            return props;
+        }
+
         /// <summary>
         /// Manually announce the current match state. Called by hotkey (Ctrl+Shift+M).
         /// </summary>
@@ -183,10 +289,10 @@ namespace TouchlineMod.Patches
             var parts = new List<string>();
 
             if (!string.IsNullOrEmpty(_lastScore))
-                parts.Add($"Score: {TextCleaner.Clean(_lastScore)}");
+                parts.Add($"Score: {_lastScore}");
 
             if (!string.IsNullOrEmpty(_lastCommentary))
-                parts.Add(TextCleaner.Clean(_lastCommentary));
+                parts.Add(_lastCommentary);
 
             if (parts.Count > 0)
             {
@@ -62,8 +62,10 @@ namespace TouchlineMod
 
             try
             {
+                // All patches target types resolved at runtime and are applied explicitly below.
+                // There are no [HarmonyPatch] classes, so PatchAll()'s scan of every type in the
+                // assembly would only add load time.
                 _harmony = new Harmony(PluginInfo.PLUGIN_GUID);
-                _harmony.PatchAll();
                 Patches.FocusPatches.ApplyManualPatches(_harmony);
                 Patches.MatchPatches.ApplyMatchPatches(_harmony);
                 Log.LogInfo("Harmony patches applied");
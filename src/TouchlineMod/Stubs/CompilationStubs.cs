@@ -64,8 +64,14 @@ namespace BepInEx.Configuration
 
     public class ConfigEntry<T>
     {
-        public T Value { get; set; }
-        public ConfigEntry(T defaultValue) { Value = defaultValue; }
+        private T _value;
+        public T Value
+        {
+            get => _value;
+            set { _value = value; SettingChanged?.Invoke(this, EventArgs.Empty); }
+        }
+        public event EventHandler SettingChanged;
+        public ConfigEntry(T defaultValue) { _value = defaultValue; }
     }
 
     public class ConfigDescription
@@ -180,6 +186,7 @@ namespace UnityEngine
 
     public static class Input
     {
+        public static bool anyKeyDown => false;
         public static bool GetKeyDown(KeyCode key) => false;
         public static bool GetKey(KeyCode key) => false;
     }
@@ -198,6 +205,8 @@ namespace UnityEngine
     public static class Time
     {
         public static float deltaTime => 0.016f;
+        public static float unscaledDeltaTime => 0.016f;
+        public static float realtimeSinceStartup => 0f;
     }
 
     public static class Application
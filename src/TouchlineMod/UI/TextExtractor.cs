@@ -2,6 +2,7 @@ using UnityEngine;
 using UnityEngine.UI;
 using System;
 using System.Collections.Generic;
+using System.Reflection;
 using System.Text;
 using TouchlineMod.Core;
 
@@ -13,6 +14,25 @@ namespace TouchlineMod.UI
     /// </summary>
     public static class TextExtractor
     {
+        // Common header container names in FM26
+        private static readonly string[] HeaderContainerNames =
+            { "Header", "Headers", "ColumnHeaders", "HeaderRow", "header" };
+
+        // Property names probed on FM/SI label components, in priority order
+        private static readonly string[] FMTextPropertyNames =
+            { "text", "Text", "Label", "label", "Value", "value", "DisplayText" };
+
+        // Reflection results per component type. The set of component types is fixed for a
+        // game session, so each type is inspected once instead of on every text read.
+        private static readonly Dictionary<Type, PropertyInfo> TMPTextProperties =
+            new Dictionary<Type, PropertyInfo>();
+        private static readonly Dictionary<Type, PropertyInfo[]> FMTextProperties =
+            new Dictionary<Type, PropertyInfo[]>();
+
+        // Scratch list for ExtractAll, cleared and refilled on each call. Text extraction
+        // only runs on the Unity main thread, so a single shared buffer is safe.
+        private static readonly List<string> TextParts = new List<string>();
+
         /// <summary>
         /// Extract all readable text from a GameObject and its immediate children.
         /// </summary>
@@ -20,7 +40,8 @@ namespace TouchlineMod.UI
         {
             if (obj == null) return string.Empty;
 
-            var texts = new List<string>();
+            var texts = TextParts;
+            texts.Clear();
 
             // Direct text components
             string directText = ExtractDirect(obj);
@@ -35,7 +56,9 @@ namespace TouchlineMod.UI
                     texts.Add(childText);
             }
 
-            return string.Join(", ", texts);
+            string result = string.Join(", ", texts);
+            texts.Clear();
+            return result;
         }
 
         /// <summary>
@@ -50,13 +73,24 @@ namespace TouchlineMod.UI
             if (text != null && !string.IsNullOrWhiteSpace(text.text))
                 return TextCleaner.Clean(text.text);
 
+            // Both reflection probes below inspect the same components; fetch them once
+            Component[] components;
+            try
+            {
+                components = obj.GetComponents<Component>();
+            }
+            catch
+            {
+                return string.Empty;
+            }
+
             // Try TextMeshPro via reflection
-            string tmpText = ExtractTMPText(obj);
+            string tmpText = ExtractTMPText(components);
             if (!string.IsNullOrEmpty(tmpText))
                 return TextCleaner.Clean(tmpText);
 
             // Try FM26/SI custom text components via reflection
-            string fmText = ExtractFMText(obj);
+            string fmText = ExtractFMText(components);
             if (!string.IsNullOrEmpty(fmText))
                 return TextCleaner.Clean(fmText);
 
@@ -71,32 +105,23 @@ namespace TouchlineMod.UI
         {
             if (rowObj == null) return string.Empty;
 
-            var cells = new List<string>();
+            // Pair cells with headers as they are read, rather than collecting them first
+            int headerCount = columnHeaders?.Count ?? 0;
+            var sb = new StringBuilder();
+            int cellIndex = 0;
             foreach (Transform cell in rowObj.transform)
             {
                 string cellText = ExtractAll(cell.gameObject);
-                if (!string.IsNullOrEmpty(cellText))
-                    cells.Add(cellText);
-            }
+                if (string.IsNullOrEmpty(cellText)) continue;
 
-            if (cells.Count == 0) return string.Empty;
-
-            // If we have column headers, pair them with values
-            if (columnHeaders != null && columnHeaders.Count > 0)
-            {
-                var sb = new StringBuilder();
-                for (int i = 0; i < cells.Count; i++)
-                {
-                    if (i > 0) sb.Append(", ");
-                    if (i < columnHeaders.Count)
-                        sb.Append($"{columnHeaders[i]}: {cells[i]}");
-                    else
-                        sb.Append(cells[i]);
-                }
-                return sb.ToString();
+                if (cellIndex > 0) sb.Append(", ");
+                if (cellIndex < headerCount)
+                    sb.Append(columnHeaders[cellIndex]).Append(": ");
+                sb.Append(cellText);
+                cellIndex++;
             }
 
-            return string.Join(", ", cells);
+            return sb.ToString();
         }
 
         /// <summary>
@@ -105,13 +130,21 @@ namespace TouchlineMod.UI
         public static List<string> ExtractTableHeaders(GameObject tableObj)
         {
             var headers = new List<string>();
-            if (tableObj == null) return headers;
+            ExtractTableHeaders(tableObj, headers);
+            return headers;
+        }
 
-            // Common header container names in FM26
-            string[] headerNames = { "Header", "Headers", "ColumnHeaders", "HeaderRow", "header" };
+        /// <summary>
+        /// Extract column headers from a table header row into an existing list.
+        /// The list is cleared first, so callers can keep one list per table context.
+        /// </summary>
+        public static void ExtractTableHeaders(GameObject tableObj, List<string> headers)
+        {
+            headers.Clear();
+            if (tableObj == null) return;
 
             Transform headerTransform = null;
-            foreach (string name in headerNames)
+            foreach (string name in HeaderContainerNames)
             {
                 headerTransform = tableObj.transform.Find(name);
                 if (headerTransform != null) break;
@@ -125,28 +158,21 @@ namespace TouchlineMod.UI
                     headers.Add(!string.IsNullOrEmpty(headerText) ? headerText : child.name);
                 }
             }
-
-            return headers;
         }
 
         /// <summary>
         /// Try to extract TextMeshPro text from a component without a compile-time dependency.
         /// </summary>
-        private static string ExtractTMPText(GameObject obj)
+        internal static string ExtractTMPText(Component[] components)
         {
             try
             {
-                var components = obj.GetComponents<Component>();
                 foreach (var comp in components)
                 {
                     if (comp == null) continue;
-                    var typeName = comp.GetType().Name;
-                    if (typeName.Contains("TextMeshPro") || typeName == "TMP_Text")
-                    {
-                        var textProp = comp.GetType().GetProperty("text");
-                        if (textProp != null)
-                            return textProp.GetValue(comp) as string;
-                    }
+                    var textProp = GetTMPTextProperty(comp.GetType());
+                    if (textProp != null)
+                        return textProp.GetValue(comp) as string;
                 }
             }
             catch { }
@@ -156,37 +182,71 @@ namespace TouchlineMod.UI
         /// <summary>
         /// Try to extract text from FM26 or SI custom label components.
         /// </summary>
-        private static string ExtractFMText(GameObject obj)
+        private static string ExtractFMText(Component[] components)
         {
             try
             {
-                var components = obj.GetComponents<Component>();
                 foreach (var comp in components)
                 {
                     if (comp == null) continue;
-                    var type = comp.GetType();
-                    var typeName = type.Name;
 
-                    // Check for common FM/SI text component patterns
-                    if (typeName.Contains("Label") || typeName.Contains("Text") ||
-                        typeName.StartsWith("SI") || typeName.StartsWith("FM"))
+                    // Try common text property names
+                    foreach (var prop in GetFMTextProperties(comp.GetType()))
                     {
-                        // Try common text property names
-                        foreach (string propName in new[] { "text", "Text", "Label", "label", "Value", "value", "DisplayText" })
-                        {
-                            var prop = type.GetProperty(propName);
-                            if (prop != null && prop.PropertyType == typeof(string))
-                            {
-                                string val = prop.GetValue(comp) as string;
-                                if (!string.IsNullOrWhiteSpace(val))
-                                    return val;
-                            }
-                        }
+                        string val = prop.GetValue(comp) as string;
+                        if (!string.IsNullOrWhiteSpace(val))
+                            return val;
                     }
                 }
             }
             catch { }
             return null;
         }
+
+        /// <summary>
+        /// Get the TextMeshPro "text" property for a component type, or null if the type
+        /// is not a TextMeshPro component. Resolved once per type.
+        /// </summary>
+        private static PropertyInfo GetTMPTextProperty(Type type)
+        {
+            if (!TMPTextProperties.TryGetValue(type, out var textProp))
+            {
+                var typeName = type.Name;
+                textProp = typeName.Contains("TextMeshPro") || typeName == "TMP_Text"
+                    ? type.GetProperty("text")
+                    : null;
+                TMPTextProperties[type] = textProp;
+            }
+            return textProp;
+        }
+
+        /// <summary>
+        /// Get the string text properties of an FM/SI label component type, in probe order.
+        /// Returns an empty array for other types. Resolved once per type.
+        /// </summary>
+        private static PropertyInfo[] GetFMTextProperties(Type type)
+        {
+            if (!FMTextProperties.TryGetValue(type, out var props))
+            {
+                var found = new List<PropertyInfo>();
+                var typeName = type.Name;
+
+                // Check for common FM/SI text component patterns
+                if (typeName.Contains("Label") || typeName.Contains("Text") ||
+                    typeName.StartsWith("SI") || typeName.StartsWith("FM"))
+                {
+                    foreach (string propName in FMTextPropertyNames)
+                    {
+                        var prop = type.GetProperty(propName);
+                        if (prop != null && prop.PropertyType == typeof(string))
+                            found.Add(prop);
+                    }
+                }
+
+                props = found.ToArray();
+                FMTextProperties[type] = props;
+            }
+            return props;
+        }
     }
 }
@@ -14,7 +14,19 @@ namespace TouchlineMod.UI
     /// </summary>
     public class UIScanner : MonoBehaviour
     {
-        private float _scanCooldown;
+        // Realtime at which another scan may start. Checked when a scan is requested,
+        // so the component needs no per-frame Update.
+        private float _nextScanAllowedAt;
+
+        private const float ScanCooldown = 5f;
+        private const int MaxScanDepth = 30;
+
+        // Indentation for each hierarchy depth, built once rather than on every emitted line
+        private static readonly string[] Indents = BuildIndents();
+        private static readonly string Separator = new string('=', 80);
+
+        // Per-node component descriptions; cleared and reused for every node in a scan
+        private readonly List<string> _nodeInfo = new List<string>();
 
         /// <summary>
         /// Perform a deep scan of all active UI elements and write results to a file.
@@ -22,18 +34,19 @@ namespace TouchlineMod.UI
         /// </summary>
         public void PerformDeepScan()
         {
-            if (_scanCooldown > 0f)
+            float now = Time.realtimeSinceStartup;
+            if (now < _nextScanAllowedAt)
             {
                 SpeechOutput.Speak("Scan in progress, please wait");
                 return;
             }
-            _scanCooldown = 5f; // Prevent spamming
+            _nextScanAllowedAt = now + ScanCooldown; // Prevent spamming
 
             try
             {
                 var sb = new StringBuilder();
                 sb.AppendLine($"Touchline UI Deep Scan - {DateTime.Now:yyyy-MM-dd HH:mm:ss}");
-                sb.AppendLine(new string('=', 80));
+                sb.AppendLine(Separator);
                 sb.AppendLine();
 
                 // Find all root GameObjects in the scene
@@ -50,13 +63,14 @@ namespace TouchlineMod.UI
                 }
 
                 sb.AppendLine();
-                sb.AppendLine(new string('=', 80));
+                sb.AppendLine(Separator);
                 sb.AppendLine($"Total elements: {totalElements}");
                 sb.AppendLine($"Interactable elements: {interactableCount}");
 
-                // Write to file in the BepInEx directory
+                // Write to file in the BepInEx directory. This stays synchronous so a failed
+                // write is reported by the catch below.
                 string outputPath = Path.Combine(Application.dataPath, "..", "BepInEx", "TouchlineUIScan.txt");
-                File.WriteAllText(outputPath, sb.ToString());
+                WriteScanReport(outputPath, sb);
 
                 SpeechOutput.Speak($"Scan complete. Found {totalElements} elements, {interactableCount} interactable. Results saved to TouchlineUIScan.txt");
                 Plugin.Log.LogInfo($"UI scan saved to {outputPath}");
@@ -68,10 +82,16 @@ namespace TouchlineMod.UI
             }
         }
 
-        private void Update()
+        /// <summary>
+        /// Write a finished scan report to disk. The builder's chunks are streamed directly,
+        /// without first copying the whole report into one large string.
+        /// </summary>
+        private static void WriteScanReport(string outputPath, StringBuilder report)
         {
-            if (_scanCooldown > 0f)
-                _scanCooldown -= Time.deltaTime;
+            using (var writer = new StreamWriter(outputPath, false))
+            {
+                writer.Write(report);
+            }
         }
 
         /// <summary>
@@ -81,9 +101,8 @@ namespace TouchlineMod.UI
             ref int totalElements, ref int interactableCount)
         {
             if (parent == null) return;
-            if (depth > 30) return; // Prevent infinite recursion
+            if (depth > MaxScanDepth) return; // Prevent infinite recursion
 
-            string indent = new string(' ', depth * 2);
             var obj = parent.gameObject;
 
             if (!obj.activeInHierarchy && depth > 0)
@@ -91,8 +110,10 @@ namespace TouchlineMod.UI
 
             totalElements++;
 
-            // Gather component info
-            var info = new List<string>();
+            // Gather component info. The list is shared across nodes: it is fully consumed
+            // before recursing into children below.
+            var info = _nodeInfo;
+            info.Clear();
             info.Add(obj.name);
 
             var text = obj.GetComponent<UnityEngine.UI.Text>();
@@ -132,11 +153,13 @@ namespace TouchlineMod.UI
 
             if (TouchlineConfig.LogUIHierarchy.Value || info.Count > 1)
             {
-                sb.AppendLine($"{indent}{string.Join(" | ", info)}");
+                sb.Append(Indents[depth]);
+                sb.AppendLine(string.Join(" | ", info));
             }
 
-            // Recurse into children
-            for (int i = 0; i < parent.childCount; i++)
+            // Recurse into children (childCount is an interop call; read it once)
+            int childCount = parent.childCount;
+            for (int i = 0; i < childCount; i++)
             {
                 ScanHierarchy(parent.GetChild(i), sb, depth + 1, ref totalElements, ref interactableCount);
             }
@@ -166,6 +189,14 @@ namespace TouchlineMod.UI
             catch { }
         }
 
+        private static string[] BuildIndents()
+        {
+            var indents = new string[MaxScanDepth + 1];
+            for (int depth = 0; depth < indents.Length; depth++)
+                indents[depth] = new string(' ', depth * 2);
+            return indents;
+        }
+
         /// <summary>
         /// Get all root GameObjects in the active scene.
         /// </summary>